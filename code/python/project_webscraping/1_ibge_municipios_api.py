@@ -1,11 +1,11 @@
 # PROJETO: Web Scraping de Dados Introdução 
-# OBJETIVO: Coletar dados de Municípios do IBGE, por meio da API e armazená-los em um arquivo CSV.
+# OBJETIVO: Coletar dados de Municípios do IBGE, por meio da API e armazená-los em um arquivo Parquet.
 # AUTOR: RODRIGO GARCIA BRUNINI
 # DATA: 20/01/2026 
 # VERSÃO: 1.0
 
 # Instalar bibliotecas necessárias:
-# pip install requests pandas
+# pip install requests orjson pyarrow
 
 # Metodologia:
 """
@@ -16,12 +16,12 @@ ETAPAS DO PROCESSO:
 2. EXTRAÇÃO: Processa o JSON retornado e extrai informações relevantes
 3. ESTRUTURAÇÃO: Organiza os dados em colunas padronizadas (id_ibge, nome, uf_sigla, uf_nome, regiao)
 4. VALIDAÇÃO: Trata valores ausentes e garante consistência dos dados
-5. EXPORTAÇÃO: Salva o resultado final em arquivo CSV
+5. EXPORTAÇÃO: Salva o resultado final em arquivo Parquet
 
 COMO USAR:
-1. Instale as dependências: pip install requests pandas
+1. Instale as dependências: pip install requests orjson pyarrow
 2. Execute o script: python webscraping_municipios.py
-3. O arquivo será salvo em: C:/Users/<seu_usuario>/Desktop/projetos/data/raw/municipios.csv
+3. O arquivo será salvo em: C:/Users/<seu_usuario>/Desktop/projetos/data/raw/municipios.parquet
    (a pasta é criada automaticamente se não existir)
 
 FONTE DOS DADOS:
@@ -30,9 +30,12 @@ API oficial IBGE: https://servicodados.ibge.gov.br/api/docs/localidades
 GLOSSÁRIO:
 - API: Interface que permite acessar dados de forma automatizada
 - JSON: Formato de dados estruturado (como uma árvore de informações)
-- DataFrame: Tabela de dados organizada em linhas e colunas
+- Tabela (pyarrow.Table): Dados organizados em colunas, sem passar pelo pandas
+- pyarrow: Biblioteca que guarda tabelas por colunas e grava Parquet de forma rápida
+- Parquet: Formato binário colunar, menor em disco e muito mais rápido de ler que CSV
 - Endpoint: Endereço específico da API para acessar determinado tipo de dado
-- safe_get: Função que busca dados aninhados sem gerar erros se algo estiver faltando
+- SESSION: Sessão HTTP compartilhada (common/http.py) que reaproveita a conexão com o IBGE
+- orjson: Biblioteca que converte o texto JSON em dicionários Python de forma rápida
 
 QUANDO USAR:
 - Para obter a base atualizada de municípios brasileiros
@@ -41,10 +44,13 @@ QUANDO USAR:
 """
 
 from pathlib import Path         # para lidar com caminhos de forma portátil
-import requests                  # para fazer requisições HTTP
-import pandas as pd              # para manipular e salvar tabelas
+import orjson                    # para ler o JSON da resposta rapidamente
+import pyarrow as pa             # para montar a tabela em colunas
+import pyarrow.compute as pc     # para contar valores únicos na verificação
+import pyarrow.parquet as pq     # para gravar o Parquet sem passar pelo pandas
 import os                        # para criar pastas se necessário
 import time                      # para pausas curtas (boa prática)
+from common.http import SESSION  # sessão HTTP compartilhada (keep-alive)
 
 # ----------- CONFIGURAÇÕES -------------
 
@@ -56,7 +62,7 @@ HEADERS = {"User-Agent": "ProjetoScrapingIBGE/ListaMunicipios/1.0 - contato: seu
 
 # Pasta de saída (ajuste se quiser outro local)
 OUTDIR = Path.home() / "Desktop" / "ebac" / "EBAC_PYTHON_WEBSCRAPING" / "data" / "raw"
-OUTFILE = OUTDIR / "municipios.csv"
+OUTFILE = OUTDIR / "municipios.parquet"
 
 # Pequena pausa entre operações (não estritamente necessária aqui, mas boa prática)
 SLEEP = 0.1
@@ -68,56 +74,47 @@ def fetch_municipios():
     Faz uma requisição GET ao endpoint de municípios do IBGE e retorna o JSON.
     Lança exceção se algo der errado (requests.raise_for_status()).
     """
-    resp = requests.get(BASE_MUNICIPIOS, headers=HEADERS, timeout=20)
+    resp = SESSION.get(BASE_MUNICIPIOS, headers=HEADERS, timeout=20)
     resp.raise_for_status()   # se o status HTTP não for 200, lança erro com informação
-    return resp.json()        # retorna lista de dicionários (cada dicionário = 1 município)
-
-def safe_get(d, *keys, default=None):
-    """
-    Acessa chaves aninhadas com segurança.
-    Ex.: safe_get(item, "microrregiao", "mesorregiao", "UF", "sigla")
-    Retorna default se algum nível não for dict ou estiver ausente.
-    """
-    cur = d
-    for k in keys:
-        if not isinstance(cur, dict):
-            return default
-        cur = cur.get(k)
-    return cur if cur is not None else default
+    return orjson.loads(resp.content)  # retorna lista de dicionários (cada dicionário = 1 município)
 
 def process_and_save(raw):
     """
-    Processa o JSON bruto e salva o CSV com colunas:
+    Processa o JSON bruto e salva o Parquet com colunas:
     id_ibge, nome, uf_sigla, uf_nome, regiao
+    As colunas são montadas como listas pré-alocadas (uma por campo) e gravadas
+    com pyarrow, sem criar um dicionário por linha nem um DataFrame do pandas.
     """
-    rows = []
-    for item in raw:
+    n = len(raw)
+    ids, nomes, siglas, ufnomes, regioes = ([None] * n for _ in range(5))
+    for i, item in enumerate(raw):
         # id e nome são campos diretos
         cid = item.get("id")
-        nome = item.get("nome")
-
-        # uf/regiao estão aninhados na estrutura; usamos safe_get para evitar erros
-        uf_sigla = safe_get(item, "microrregiao", "mesorregiao", "UF", "sigla")
-        uf_nome = safe_get(item, "microrregiao", "mesorregiao", "UF", "nome")
-        regiao = safe_get(item, "microrregiao", "mesorregiao", "UF", "regiao", "nome")
-
-        rows.append({
-            "id_ibge": str(cid) if cid is not None else None,  # padronizar como string
-            "nome": nome,
-            "uf_sigla": uf_sigla,
-            "uf_nome": uf_nome,
-            "regiao": regiao
-        })
-
-    # transformar em DataFrame e salvar CSV
-    df = pd.DataFrame(rows)
+        ids[i] = str(cid) if cid is not None else None  # padronizar como string
+        nomes[i] = item.get("nome")
+
+        # uf/regiao estão aninhados na estrutura; percorremos até a UF uma única vez
+        # ("or {}" cobre níveis ausentes ou nulos sem gerar erros)
+        uf = ((item.get("microrregiao") or {}).get("mesorregiao") or {}).get("UF") or {}
+        siglas[i] = uf.get("sigla")
+        ufnomes[i] = uf.get("nome")
+        regioes[i] = (uf.get("regiao") or {}).get("nome")
+
+    # montar a tabela colunar (tipo string explícito: sem inferência de tipos)
+    table = pa.table({
+        "id_ibge": pa.array(ids, type=pa.string()),
+        "nome": pa.array(nomes, type=pa.string()),
+        "uf_sigla": pa.array(siglas, type=pa.string()),
+        "uf_nome": pa.array(ufnomes, type=pa.string()),
+        "regiao": pa.array(regioes, type=pa.string())
+    })
 
     # garantir que a pasta exista
     os.makedirs(OUTDIR, exist_ok=True)
 
-    # salvar CSV com encoding utf-8
-    df.to_csv(OUTFILE, index=False, encoding="utf-8")
-    return df
+    # salvar Parquet (compressão snappy)
+    pq.write_table(table, OUTFILE, compression="snappy")
+    return table
 
 def main():
     print("🔍 Buscando lista de municípios do IBGE...")
@@ -127,32 +124,29 @@ def main():
     time.sleep(SLEEP)
 
     print(f" Total de registros recebidos: {len(raw)}")
-    df = process_and_save(raw)
+    tabela = process_and_save(raw)
 
-    print(" CSV salvo em:", OUTFILE)
-    print(f" Total de municípios no CSV: {len(df)}")
+    print(" Parquet salvo em:", OUTFILE)
+    print(f" Total de municípios no arquivo: {tabela.num_rows}")
 
-if __name__ == "__main__":
-    main()
-
-# ----------- VERIFICAÇÃO DOS DADOS -------------
+    # ----------- VERIFICAÇÃO DOS DADOS -------------
+    # Usa a tabela que já está em memória (não relê o arquivo gravado)
 
-# Carrega o arquivo gerado para verificação
-caminho_db = pd.read_csv(OUTFILE, encoding="utf-8")
-df = caminho_db
+    # Exibe as primeiras linhas
+    print("\n Primeiras linhas do arquivo:")
+    print(tabela.slice(0, 5).to_pylist())
 
-# Exibe as primeiras linhas
-print("\n Primeiras linhas do arquivo:")
-print(df.head())
+    # Mostra informações sobre a estrutura dos dados
+    print("\n Informações sobre o dataset:")
+    print(tabela.schema)
 
-# Mostra informações sobre a estrutura dos dados
-print("\n Informações sobre o dataset:")
-print(df.info())
+    # Conta quantos estados únicos existem
+    print(f"\n Total de UFs (estados) únicos: {pc.count_distinct(tabela['uf_nome']).as_py()}")
 
-# Conta quantos estados únicos existem
-print(f"\n Total de UFs (estados) únicos: {df['uf_nome'].nunique()}")
+    # Conta quantos municípios únicos existem
+    print(f"\n Total de municípios únicos: {pc.count_distinct(tabela['nome']).as_py()}")
 
-# Conta quantos municípios únicos existem
-print(f"\n Total de municípios únicos: {df['nome'].nunique()}")
+if __name__ == "__main__":
+    main()
 
 # Fim do script #
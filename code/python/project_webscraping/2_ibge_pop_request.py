@@ -26,48 +26,53 @@ URL: https://www.ibge.gov.br/estatisticas/sociais/populacao/9103-estimativas-de-
 
 GLOSSÁRIO:
 - FTP: Protocolo de transferência de arquivos (forma de baixar arquivos de servidores)
-- Streaming: Download em partes pequenas, evitando sobrecarregar a memória
-- chunk_size: Tamanho de cada parte baixada (8192 bytes = 8KB por vez)
+- Streaming: Download em partes, evitando sobrecarregar a memória
+- chunk_size: Tamanho de cada parte baixada (1048576 bytes = 1MB por vez)
+- shutil.copyfileobj: Copia os bytes da resposta direto para o arquivo, sem laço em Python
 - Path: Objeto que representa caminhos de arquivos de forma compatível com qualquer sistema operacional
+- SESSION: Sessão HTTP compartilhada (common/http.py) que reaproveita a conexão com o IBGE
 - raise_for_status(): Verifica se houve erro no download e interrompe se necessário
 
 OBSERVAÇÕES:
 - Este script apenas baixa o arquivo original (.xls)
 - Não realiza conversões ou transformações nos dados
 - Se o arquivo já existir, será sobrescrito
-- O arquivo baixado será usado como base para processamentos posteriores
+- O script 3_col_pop.py já baixa a planilha direto para a memória; este script
+  é útil apenas quando se quer somente o arquivo original em disco
 """
 
 # Bibliotecas
 from pathlib import Path
-import requests
+import shutil
+from common.http import SESSION
 
 # URL direta do arquivo .xls (conforme indicado)
 XLS_URL = "https://ftp.ibge.gov.br/Estimativas_de_Populacao/Estimativas_2025/POP2025_20260113.xls"
 
 # Caminho onde o arquivo será salvo (ajuste se quiser outro local)
 OUTDIR = Path.home() / "Desktop" / "ebac" / "EBAC_PYTHON_WEBSCRAPING" / "data" / "raw"
-OUTDIR.mkdir(parents=True, exist_ok=True)
 XLS_LOCAL = OUTDIR / "populacao.xls"
 
-def download_xls_only(url: str, dest: Path, chunk_size: int = 8192):
+def download_xls_only(url: str, dest: Path, chunk_size: int = 1024 * 1024):
     """
     Baixa o arquivo de 'url' em streaming e salva em 'dest'.
     Se já existir, será sobrescrito.
+    A cópia rede -> disco é feita pelo shutil.copyfileobj, em blocos de 'chunk_size' bytes.
     """
     print(f"Baixando: {url}")
-    resp = requests.get(url, stream=True, timeout=60)
-    resp.raise_for_status()
+    # o .xls já é binário: pedimos o arquivo sem compressão (identity)
+    with SESSION.get(url, stream=True, timeout=60, headers={"Accept-Encoding": "identity"}) as resp:
+        resp.raise_for_status()
+        resp.raw.decode_content = True  # descompacta caso o servidor envie gzip mesmo assim
 
-    with open(dest, "wb") as f:
-        for chunk in resp.iter_content(chunk_size=chunk_size):
-            if chunk:
-                f.write(chunk)
+        with open(dest, "wb") as f:
+            shutil.copyfileobj(resp.raw, f, length=chunk_size)
 
     print("Arquivo salvo em:", dest)
     return dest
 
 def main():
+    OUTDIR.mkdir(parents=True, exist_ok=True)
     download_xls_only(XLS_URL, XLS_LOCAL)
 
 if __name__ == "__main__":
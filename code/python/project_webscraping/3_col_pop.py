@@ -8,11 +8,12 @@
 """
 Este script processa dados populacionais dos municípios brasileiros seguindo estas etapas:
 
-1. LEITURA: Importa o arquivo Excel com dados de população municipal
-2. PADRONIZAÇÃO: Ajusta códigos de UF (2 dígitos) e Município (5 dígitos) com zeros à esquerda
-3. CRIAÇÃO DO ID: Gera o código IBGE único (7 dígitos) combinando UF + Município
+1. LEITURA: Baixa o arquivo Excel do IBGE direto para a memória (BytesIO) e o lê com o pandas
+   (uma cópia do .xls original é gravada em data/raw/populacao.xls para referência)
+2. PADRONIZAÇÃO: Converte os códigos de UF e Município para número (linhas de notas viram nulo)
+3. CRIAÇÃO DO ID: Gera o código IBGE único (7 dígitos) com UF * 100000 + Município
 4. REORGANIZAÇÃO: Posiciona a coluna id_ibge como primeira coluna da tabela
-5. EXPORTAÇÃO: Salva o resultado final em formato CSV
+5. EXPORTAÇÃO: Salva o resultado final em formato Parquet
 
 Exemplo prático:
 - Código UF: "35" (São Paulo)
@@ -21,38 +22,65 @@ Exemplo prático:
 
 Glossário:
 - DataFrame: Tabela de dados (como uma planilha Excel)
-- fillna(""): Substitui células vazias por texto vazio
+- BytesIO: "arquivo" em memória; evita gravar e reler o .xls do disco
+- calamine: leitor de planilhas nativo (pip install python-calamine) usado pelo pandas
+- to_numeric: Converte texto em número; errors="coerce" transforma valores inválidos em nulo
+- Int64: Tipo inteiro do pandas que aceita valores nulos
 - zfill(n): Completa com zeros à esquerda até ter n dígitos
 - id_ibge: Código padrão IBGE de 7 dígitos para identificar municípios
 """
 
+import io
+import shutil
 import pandas as pd
 from pathlib import Path
+from common.http import SESSION
+
+# URL direta do arquivo .xls (a mesma usada em 2_ibge_pop_request.py)
+XLS_URL = "https://ftp.ibge.gov.br/Estimativas_de_Populacao/Estimativas_2025/POP2025_20260113.xls"
 
 # Caminho onde o arquivo será salvo (ajuste se quiser outro local)
 OUTDIR = Path.home() / "Desktop" / "ebac" / "EBAC_PYTHON_WEBSCRAPING" / "data" / "raw"
-OUTDIR.mkdir(parents=True, exist_ok=True)
 INPUT_PATH = OUTDIR / "populacao.xls"
-OUTPUT_PATH = OUTDIR / "pop_corrigida.csv"
+OUTPUT_PATH = OUTDIR / "pop_corrigida.parquet"
 SHEET_NAME = "Municípios"
 
-# Leitura da planilha (header correto é 1)
-df = pd.read_excel(INPUT_PATH, sheet_name=SHEET_NAME, header=1, dtype=str)
+def main():
+    OUTDIR.mkdir(parents=True, exist_ok=True)
+
+    # Download do .xls direto para a memória
+    buf = io.BytesIO()
+    with SESSION.get(XLS_URL, stream=True, timeout=60, headers={"Accept-Encoding": "identity"}) as resp:
+        resp.raise_for_status()
+        resp.raw.decode_content = True
+        shutil.copyfileobj(resp.raw, buf, length=1024 * 1024)
+
+    # Guarda o arquivo original em disco (uma única escrita, sem releitura)
+    INPUT_PATH.write_bytes(buf.getbuffer())
+
+    # Leitura da planilha a partir da memória (header correto é 1)
+    # engine="calamine": leitor de Excel escrito em Rust, bem mais rápido que o xlrd
+    buf.seek(0)
+    df = pd.read_excel(buf, sheet_name=SHEET_NAME, header=1, dtype=str, engine="calamine")
+
+    # Converte os códigos para inteiros (notas de rodapé e células vazias viram nulo)
+    uf = pd.to_numeric(df["COD. UF"], errors="coerce").astype("Int64")
+    mun = pd.to_numeric(df["COD. MUNIC"], errors="coerce").astype("Int64")
+
+    # Cria o Id_ibge: UF (2 dígitos) seguida do Município (5 dígitos)
+    df["id_ibge"] = (uf * 100000 + mun).astype("string").str.zfill(7)
 
-# Garante que são strings e remove NaN
-df["COD. UF"] = df["COD. UF"].fillna("").str.zfill(2)
-df["COD. MUNIC"] = df["COD. MUNIC"].fillna("").str.zfill(5)
+    # Move Id_ibge para a primeira coluna (sem copiar o DataFrame)
+    df.insert(0, "id_ibge", df.pop("id_ibge"))
 
-# Cria o Id_ibge
-df["id_ibge"] = df["COD. UF"] + df["COD. MUNIC"]
+    # Salva o resultado
+    df.to_parquet(OUTPUT_PATH, index=False, compression="snappy", engine="pyarrow")
+    print("Arquivo gerado com sucesso em:")
+    print(OUTPUT_PATH)
 
-# Move Id_ibge para a primeira coluna
-cols = ["id_ibge"] + [c for c in df.columns if c != "id_ibge"]
-df = df[cols]
+    return df
 
-# Salva o resultado
-df.to_csv(OUTPUT_PATH, index=False, encoding="utf-8")
-print("Arquivo gerado com sucesso em:")
-print(OUTPUT_PATH)
+if __name__ == "__main__":
+    main()
 
 # Fim do script #
\ No newline at end of file
@@ -10,9 +10,10 @@
 Este script realiza análise estatística descritiva dos dados populacionais dos municípios brasileiros.
 
 ETAPAS DO PROCESSO:
-1. LEITURA: Carrega o arquivo consolidado de municípios com população
+1. LEITURA: Carrega o arquivo consolidado de municípios com população (common/loader.py)
 2. LIMPEZA: Padroniza formato numérico da população (remove pontos/vírgulas)
 3. CONVERSÃO: Transforma dados de texto para valores numéricos
+   (etapas 1 a 3 ficam em cache no arquivo pop_mun_final.feather)
 4. ANÁLISE DESCRITIVA: Calcula média, mediana, desvio padrão, mínimo e máximo
 5. DETECÇÃO DE OUTLIERS: Identifica municípios com população atípica usando método IQR
 6. CONSOLIDAÇÃO: Gera relatório estruturado com todas as métricas
@@ -34,92 +35,91 @@ GLOSSÁRIO:
 - Quartil: divisão dos dados em 4 partes iguais
 - Desvio Padrão: indica o quanto os valores variam em relação à média
 - Mediana: valor do meio, menos sensível a valores extremos que a média
+- count_nonzero: conta quantos valores verdadeiros existem em uma máscara booleana
 - coerce: força conversão para número, transformando erros em NaN (valor ausente)
 
 RESULTADO:
 Arquivo salvo em: C:/Users/<seu_usuario>/Desktop/projetos/data/ready/relatorio_estatistico_pop.csv
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from common.loader import load_clean
 
 # Caminho do arquivo
 OUTDIR = Path.home() / "Desktop" / "ebac" / "EBAC_PYTHON_WEBSCRAPING" / "data" / "ready"
-
-input_path = OUTDIR /"pop_mun_final.csv"
 output_path = OUTDIR / "relatorio_estatistico_pop.csv"
 
-# Leitura dos dados
-df = pd.read_csv(input_path, dtype=str)
-
-# Padroniza nomes de colunas
-df.columns = [c.strip() for c in df.columns]
-
-# Converte população para formato numérico
-# Remove pontos de milhar e substitui vírgula decimal por ponto
-df["POPULAÇÃO ESTIMADA"] = (
-    df["POPULAÇÃO ESTIMADA"]
-    .str.replace(".", "", regex=False)
-    .str.replace(",", ".", regex=False)
-)
-df["POPULAÇÃO ESTIMADA"] = pd.to_numeric(df["POPULAÇÃO ESTIMADA"], errors="coerce")
-
-# Estatística descritiva básica
-estatisticas = df["POPULAÇÃO ESTIMADA"].describe()
-
-# Conta valores ausentes
-faltantes = df["POPULAÇÃO ESTIMADA"].isna().sum()
-
-# Detecção de outliers usando método IQR
-q1 = df["POPULAÇÃO ESTIMADA"].quantile(0.25)
-q3 = df["POPULAÇÃO ESTIMADA"].quantile(0.75)
-iqr = q3 - q1
-limite_inferior = q1 - 1.5 * iqr
-limite_superior = q3 + 1.5 * iqr
-
-outliers = df[
-    (df["POPULAÇÃO ESTIMADA"] < limite_inferior) |
-    (df["POPULAÇÃO ESTIMADA"] > limite_superior)
-]
-
-# Consolida relatório em formato estruturado
-relatorio = pd.DataFrame({
-    "Métrica": [
-        "Total de Municípios",
-        "População Média",
-        "População Mediana",
-        "Desvio Padrão",
-        "Mínimo",
-        "Máximo",
-        "1º Quartil",
-        "3º Quartil",
-        "Valores Ausentes",
-        "Outliers Detectados"
-    ],
-    "Valor": [
-        int(estatisticas["count"]),
-        round(estatisticas["mean"], 2),
-        round(estatisticas["50%"], 2),
-        round(estatisticas["std"], 2),
-        int(estatisticas["min"]),
-        int(estatisticas["max"]),
-        int(q1),
-        int(q3),
-        int(faltantes),
-        len(outliers)
-    ]
-})
-
-# Cria pasta se não existir
-Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-
-# Salva relatório
-relatorio.to_csv(output_path, index=False, encoding="utf-8")
-
-# Exibe resumo no terminal
-print("\n===== ESTATISTICA DESCRITIVA DA POPULACAO =====\n")
-print(relatorio)
-print("\nRelatorio salvo em:")
-print(output_path)
+def main(df=None):
+    """
+    Gera o relatório estatístico. Aceita um DataFrame já carregado (ex.: run_all.py);
+    se não for informado, usa load_clean().
+    """
+    # Leitura dos dados já limpos (população numérica)
+    if df is None:
+        df = load_clean()
+
+    # Estatística descritiva básica (já inclui os quartis 25%, 50% e 75%)
+    estatisticas = df["POPULAÇÃO ESTIMADA"].describe()
+
+    # Conta valores ausentes
+    faltantes = df["POPULAÇÃO ESTIMADA"].isna().sum()
+
+    # Detecção de outliers usando método IQR (quartis reaproveitados do describe)
+    q1, q3 = estatisticas["25%"], estatisticas["75%"]
+    iqr = q3 - q1
+    limite_inferior = q1 - 1.5 * iqr
+    limite_superior = q3 + 1.5 * iqr
+
+    # Conta os outliers direto na coluna (sem criar um DataFrame filtrado)
+    pop = df["POPULAÇÃO ESTIMADA"].to_numpy()
+    mask = (pop < limite_inferior) | (pop > limite_superior)
+    n_outliers = int(np.count_nonzero(mask))
+
+    # Consolida relatório em formato estruturado
+    relatorio = pd.DataFrame({
+        "Métrica": [
+            "Total de Municípios",
+            "População Média",
+            "População Mediana",
+            "Desvio Padrão",
+            "Mínimo",
+            "Máximo",
+            "1º Quartil",
+            "3º Quartil",
+            "Valores Ausentes",
+            "Outliers Detectados"
+        ],
+        "Valor": [
+            int(estatisticas["count"]),
+            round(estatisticas["mean"], 2),
+            round(estatisticas["50%"], 2),
+            round(estatisticas["std"], 2),
+            int(estatisticas["min"]),
+            int(estatisticas["max"]),
+            int(q1),
+            int(q3),
+            int(faltantes),
+            n_outliers
+        ]
+    })
+
+    # Cria pasta se não existir
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+
+    # Salva relatório
+    relatorio.to_csv(output_path, index=False, encoding="utf-8")
+
+    # Exibe resumo no terminal
+    print("\n===== ESTATISTICA DESCRITIVA DA POPULACAO =====\n")
+    print(relatorio)
+    print("\nRelatorio salvo em:")
+    print(output_path)
+
+    return relatorio
+
+if __name__ == "__main__":
+    main()
 
 # Fim do script
@@ -10,11 +10,11 @@
 Este script gera visualizações gráficas para análise da distribuição populacional brasileira.
 
 ETAPAS DO PROCESSO:
-1. LEITURA: Carrega o arquivo consolidado de municípios com população
-2. LIMPEZA: Padroniza formato numérico e remove registros sem dados
-3. PREPARAÇÃO: Cria identificadores compostos (Município + UF)
-4. AGREGAÇÃO: Agrupa dados por Estado, Região e Município
-5. VISUALIZAÇÃO: Gera 4 gráficos diferentes para análise
+1. LEITURA: Carrega o arquivo consolidado de municípios com população (common/loader.py)
+2. LIMPEZA: Remove registros sem dados (a conversão numérica já vem do loader)
+3. PREPARAÇÃO: Cria identificadores compostos (Município + UF) apenas para os municípios exibidos
+4. AGREGAÇÃO: Agrupa dados por Estado e Região (uma única vez) e seleciona os extremos dos Municípios
+5. VISUALIZAÇÃO: Gera 4 gráficos diferentes para análise (em paralelo, um por thread)
 6. EXPORTAÇÃO: Salva todas as imagens em formato PNG
 
 GRÁFICOS GERADOS:
@@ -28,9 +28,13 @@ GLOSSÁRIO:
 - sum(): soma valores de uma coluna
 - sort_values: ordena dados de forma crescente ou decrescente
 - ascending=False: ordem decrescente (maior para menor)
-- head(10): seleciona apenas os 10 primeiros registros
+- nlargest/nsmallest(10): seleciona os 10 maiores/menores valores sem ordenar a tabela inteira
+- level: agrupa pelo nível do índice de uma tabela já agregada
 - autopct: formato de exibição de percentuais no gráfico de pizza
 - tight_layout: ajusta espaçamento automático para evitar sobreposição
+- Agg: backend do matplotlib que só gera imagens, sem abrir janelas
+- Figure: figura independente do matplotlib (não depende do estado global do pyplot)
+- ThreadPoolExecutor: executa funções em paralelo, aqui uma por gráfico
 - ha="right": alinha texto à direita (horizontal alignment)
 
 DEPENDÊNCIAS:
@@ -44,110 +48,134 @@ Gráficos salvos em: C:/Users/<seu_usuario>/Desktop/projetos/graficos/
 - top10_menores_municipios.png
 """
 
-import pandas as pd
-import matplotlib.pyplot as plt
+from concurrent.futures import ThreadPoolExecutor
+import matplotlib
+matplotlib.use("Agg")  # backend sem interface gráfica: apenas gera os arquivos PNG
+from matplotlib.figure import Figure
 from pathlib import Path
+from common.loader import load_clean
 
 # Caminhos
-OUTDIR = Path.home() / "Desktop" / "ebac" / "EBAC_PYTHON_WEBSCRAPING" / "data" / "ready"
-input_path = OUTDIR / "pop_mun_final.csv"
 output_dir = Path.home() / "Desktop" / "ebac" / "EBAC_PYTHON_WEBSCRAPING" / "graficos"
-Path(output_dir).mkdir(parents=True, exist_ok=True)
-
-# Leitura dos dados
-df = pd.read_csv(input_path, dtype=str)
-df.columns = [c.strip() for c in df.columns]
-
-# Conversão da população para formato numérico
-df["POPULAÇÃO ESTIMADA"] = (
-    df["POPULAÇÃO ESTIMADA"]
-    .str.replace(".", "", regex=False)
-    .str.replace(",", ".", regex=False)
-)
-df["POPULAÇÃO ESTIMADA"] = pd.to_numeric(df["POPULAÇÃO ESTIMADA"], errors="coerce")
-
-# Remove registros sem população
-df = df.dropna(subset=["POPULAÇÃO ESTIMADA"])
-
-# Cria identificador completo: Município + UF
-df["MUNICIPIO_UF"] = df["nome"] + " - " + df["uf_sigla"]
-
-# ================================
-# 1) Gráfico de barras - População por Estado
-# ================================
-pop_uf = (
-    df.groupby("uf_sigla")["POPULAÇÃO ESTIMADA"]
-    .sum()
-    .sort_values(ascending=False)
-)
-
-plt.figure(figsize=(12,6))
-pop_uf.plot(kind="bar")
-plt.title("População Estimada por Estado (UF)")
-plt.xlabel("Estado (UF)")
-plt.ylabel("População Estimada")
-plt.xticks(rotation=45)
-plt.tight_layout()
-plt.savefig(f"{output_dir}\\populacao_por_estado.png")
-plt.close()
-
-# ================================
-# 2) Gráfico de pizza - População por Região
-# ================================
-pop_regiao = (
-    df.groupby("regiao")["POPULAÇÃO ESTIMADA"]
-    .sum()
-)
-
-plt.figure(figsize=(8,8))
-pop_regiao.plot(kind="pie", autopct="%1.1f%%")
-plt.title("Distribuição da População por Região")
-plt.ylabel("")
-plt.tight_layout()
-plt.savefig(f"{output_dir}\\populacao_por_regiao.png")
-plt.close()
-
-# ================================
-# 3) Gráfico de colunas - Top 10 municípios mais populosos
-# ================================
-top10_maiores = (
-    df.groupby("MUNICIPIO_UF")["POPULAÇÃO ESTIMADA"]
-    .sum()
-    .sort_values(ascending=False)
-    .head(10)
-)
-
-plt.figure(figsize=(12,6))
-top10_maiores.plot(kind="bar")
-plt.title("Top 10 Municípios Mais Populosos do Brasil")
-plt.xlabel("Município - UF")
-plt.ylabel("População Estimada")
-plt.xticks(rotation=45, ha="right")
-plt.tight_layout()
-plt.savefig(f"{output_dir}\\top10_maiores_municipios.png")
-plt.close()
 
 # ================================
-# 4) Gráfico de colunas - Top 10 municípios menos populosos
+# Funções de geração dos gráficos
 # ================================
-top10_menores = (
-    df.groupby("MUNICIPIO_UF")["POPULAÇÃO ESTIMADA"]
-    .sum()
-    .sort_values(ascending=True)
-    .head(10)
-)
-
-plt.figure(figsize=(12,6))
-top10_menores.plot(kind="bar")
-plt.title("Top 10 Municípios Menos Populosos do Brasil")
-plt.xlabel("Município - UF")
-plt.ylabel("População Estimada")
-plt.xticks(rotation=45, ha="right")
-plt.tight_layout()
-plt.savefig(f"{output_dir}\\top10_menores_municipios.png")
-plt.close()
-
-print("Gráficos gerados com sucesso em:")
-print(output_dir)
+# Cada função cria a sua própria Figure (API orientada a objetos, sem o estado
+# global do pyplot), o que permite gerar os quatro gráficos em paralelo.
+
+def plot_populacao_estado(pop_uf, out_dir):
+    """Gráfico de barras - População por Estado."""
+    fig = Figure(figsize=(12,6))
+    ax = fig.subplots()
+    pop_uf.plot(kind="bar", ax=ax)
+    ax.set_title("População Estimada por Estado (UF)")
+    ax.set_xlabel("Estado (UF)")
+    ax.set_ylabel("População Estimada")
+    ax.tick_params(axis="x", labelrotation=45)
+    fig.tight_layout()
+    fig.savefig(out_dir / "populacao_por_estado.png")
+
+def plot_populacao_regiao(pop_regiao, out_dir):
+    """Gráfico de pizza - População por Região."""
+    fig = Figure(figsize=(8,8))
+    ax = fig.subplots()
+    pop_regiao.plot(kind="pie", autopct="%1.1f%%", ax=ax)
+    ax.set_title("Distribuição da População por Região")
+    ax.set_ylabel("")
+    fig.tight_layout()
+    fig.savefig(out_dir / "populacao_por_regiao.png")
+
+def plot_top10(top10, titulo, arquivo, out_dir):
+    """Gráfico de colunas - Top 10 municípios (maiores ou menores)."""
+    fig = Figure(figsize=(12,6))
+    ax = fig.subplots()
+    top10.plot(kind="bar", ax=ax)
+    ax.set_title(titulo)
+    ax.set_xlabel("Município - UF")
+    ax.set_ylabel("População Estimada")
+    ax.tick_params(axis="x", labelrotation=45)
+    for label in ax.get_xticklabels():
+        label.set_horizontalalignment("right")
+    fig.tight_layout()
+    fig.savefig(out_dir / arquivo)
+
+def main(df=None):
+    """
+    Gera os quatro gráficos. Aceita um DataFrame já carregado (ex.: run_all.py);
+    se não for informado, usa load_clean().
+    """
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    # Leitura dos dados já limpos (população numérica)
+    if df is None:
+        df = load_clean()
+
+    # Remove registros sem população
+    df = df.dropna(subset=["POPULAÇÃO ESTIMADA"])
+
+    # Agregação única por Estado e Região (cada UF pertence a uma só região);
+    # os totais por Estado e por Região saem desta mesma tabela
+    pop_uf_regiao = df.groupby(["uf_sigla", "regiao"])["POPULAÇÃO ESTIMADA"].sum()
+
+    # População por município (cada município aparece uma vez na base)
+    pop_municipios = df["POPULAÇÃO ESTIMADA"]
+
+    # ================================
+    # 1) Gráfico de barras - População por Estado
+    # ================================
+    pop_uf = (
+        pop_uf_regiao.groupby(level="uf_sigla")
+        .sum()
+        .sort_values(ascending=False)
+    )
+
+    # ================================
+    # 2) Gráfico de pizza - População por Região
+    # ================================
+    pop_regiao = (
+        pop_uf_regiao.groupby(level="regiao")
+        .sum()
+    )
+
+    # ================================
+    # 3) Gráfico de colunas - Top 10 municípios mais populosos
+    # ================================
+    top10_maiores = pop_municipios.nlargest(10)
+
+    # Identificador completo (Município - UF) criado só para as 10 linhas exibidas
+    idx = top10_maiores.index
+    top10_maiores.index = df.loc[idx, "nome"] + " - " + df.loc[idx, "uf_sigla"]
+
+    # ================================
+    # 4) Gráfico de colunas - Top 10 municípios menos populosos
+    # ================================
+    top10_menores = pop_municipios.nsmallest(10)
+
+    # Identificador completo (Município - UF) criado só para as 10 linhas exibidas
+    idx = top10_menores.index
+    top10_menores.index = df.loc[idx, "nome"] + " - " + df.loc[idx, "uf_sigla"]
+
+    # ================================
+    # Geração em paralelo (a codificação PNG libera o GIL)
+    # ================================
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(plot_populacao_estado, pop_uf, output_dir),
+            executor.submit(plot_populacao_regiao, pop_regiao, output_dir),
+            executor.submit(plot_top10, top10_maiores, "Top 10 Municípios Mais Populosos do Brasil",
+                            "top10_maiores_municipios.png", output_dir),
+            executor.submit(plot_top10, top10_menores, "Top 10 Municípios Menos Populosos do Brasil",
+                            "top10_menores_municipios.png", output_dir),
+        ]
+        # result() propaga qualquer erro ocorrido dentro das threads
+        for future in futures:
+            future.result()
+
+    print("Gráficos gerados com sucesso em:")
+    print(output_dir)
+
+if __name__ == "__main__":
+    main()
 
 # Fim do script
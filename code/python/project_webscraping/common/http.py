@@ -0,0 +1,57 @@
+# PROJETO: Web Scraping de Dados Introdução
+# OBJETIVO: Sessão HTTP compartilhada pelos scripts que acessam os serviços do IBGE.
+
+"""
+Sessão HTTP única (requests.Session) usada nas requisições ao IBGE.
+
+- Mantém a conexão aberta (keep-alive) e reaproveita o pool de conexões,
+  evitando um novo handshake TCP/TLS a cada requisição.
+- Tenta novamente (até 3 vezes) em caso de falha de conexão ou de erro
+  temporário do servidor (502, 503, 504).
+- Abre os sockets com TCP_NODELAY. O buffer de recepção (SO_RCVBUF) fica por conta
+  do sistema: fixá-lo desliga o ajuste automático do Linux e o valor é limitado por
+  net.core.rmem_max (~208 KiB por padrão), o que na prática diminuiria a janela TCP.
+
+COMO USAR (a partir de um script da pasta project_webscraping):
+    from common.http import SESSION
+    resp = SESSION.get(url, timeout=20)
+
+GLOSSÁRIO:
+- Session: objeto que guarda conexões e cabeçalhos entre requisições
+- HTTPAdapter: define o tamanho do pool de conexões e a política de novas tentativas
+- Retry: regra de novas tentativas com espera crescente (backoff)
+- SO_RCVBUF: tamanho do buffer de recepção do socket (limita a janela TCP)
+- rmem_max: limite do Linux para o SO_RCVBUF definido pelo programa
+- TCP_NODELAY: envia pacotes pequenos sem esperar acumular (sem atraso de Nagle)
+"""
+
+import socket
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Cabeçalho HTTP padrão: identificar seu script é permitido para o servidor
+HEADERS = {"User-Agent": "ProjetoScrapingIBGE/1.0 - contato: seu-email@exemplo.com"}
+
+# Opções aplicadas a cada socket antes da conexão
+SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+]
+
+class SocketOptionsAdapter(HTTPAdapter):
+    """HTTPAdapter que abre as conexões com as opções de socket de SOCKET_OPTIONS."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount(
+    "https://",
+    SocketOptionsAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    )
+)
@@ -0,0 +1,24 @@
+# PROJETO: Web Scraping de Dados Introdução
+# OBJETIVO: Padronizar os códigos de município do IBGE usados nas junções com as malhas.
+
+"""
+Padronização do código IBGE compartilhada pelos scripts de mapas (7 e 8).
+
+COMO USAR (a partir de um script da pasta project_webscraping):
+    from common.ibge import padroniza_id_ibge
+    df["id_ibge"] = padroniza_id_ibge(df["id_ibge"])
+
+GLOSSÁRIO:
+- Int64: tipo inteiro do pandas que aceita valores nulos
+- zfill: completa o texto com zeros à esquerda até o tamanho pedido
+"""
+
+import pandas as pd
+
+
+def padroniza_id_ibge(serie):
+    """
+    Converte o código IBGE para texto de 7 dígitos em uma única conversão numérica
+    (remove o sufixo ".0" de códigos lidos como float e completa com zeros à esquerda).
+    """
+    return pd.to_numeric(serie, errors="coerce").astype("Int64").astype("string").str.zfill(7)
@@ -0,0 +1,64 @@
+# PROJETO: Web Scraping de Dados Introdução
+# OBJETIVO: Carregar a base final (municípios + população) já limpa, com cache em disco.
+
+"""
+Carregamento compartilhado da base pop_mun_final pelos scripts de análise (5, 6, 7 e 8).
+
+ETAPAS DO PROCESSO:
+1. CACHE: Se pop_mun_final.feather existir e for mais novo que o Parquet (ou se o Parquet
+   não existir mais), lê direto dele
+2. LEITURA: Caso contrário, carrega pop_mun_final.parquet (gerado pelo 4_join_pop_mun.py)
+3. LIMPEZA: Padroniza nomes de colunas e converte a população para número
+4. CACHE: Grava o resultado em pop_mun_final.feather para as próximas execuções
+
+COMO USAR (a partir de um script da pasta project_webscraping):
+    from common.loader import load_clean
+    df = load_clean()
+
+GLOSSÁRIO:
+- Feather: formato binário (Arrow IPC) de leitura muito rápida, usado aqui como cache
+- mtime: data de modificação do arquivo; usada para saber se o cache está desatualizado
+- translate: troca/remove vários caracteres do texto em uma só passada
+"""
+
+import pandas as pd
+from pathlib import Path
+
+# Caminhos
+OUTDIR = Path.home() / "Desktop" / "ebac" / "EBAC_PYTHON_WEBSCRAPING" / "data" / "ready"
+INPUT_PATH = OUTDIR / "pop_mun_final.parquet"
+CACHE_PATH = OUTDIR / "pop_mun_final.feather"
+
+# Tabela de tradução: remove "." (milhar) e troca "," por "." (decimal)
+SEPARADORES = {ord("."): None, ord(","): ord(".")}
+
+
+def load_clean() -> pd.DataFrame:
+    """
+    Retorna a base pop_mun_final com a coluna "POPULAÇÃO ESTIMADA" numérica.
+    Usa o cache em Feather quando ele é mais recente que o Parquet de origem
+    (ou quando só o cache existe).
+    """
+    if not INPUT_PATH.exists():
+        if CACHE_PATH.exists():
+            return pd.read_feather(CACHE_PATH)
+        raise FileNotFoundError(
+            f"{INPUT_PATH} não encontrado: execute antes o 4_join_pop_mun.py"
+        )
+
+    if CACHE_PATH.exists() and CACHE_PATH.stat().st_mtime >= INPUT_PATH.stat().st_mtime:
+        return pd.read_feather(CACHE_PATH)
+
+    df = pd.read_parquet(INPUT_PATH)
+
+    # Padroniza nomes de colunas
+    df.columns = [c.strip() for c in df.columns]
+
+    # Converte população para formato numérico (uma única passada sobre o texto)
+    df["POPULAÇÃO ESTIMADA"] = pd.to_numeric(
+        df["POPULAÇÃO ESTIMADA"].str.translate(SEPARADORES),
+        errors="coerce"
+    )
+
+    df.to_feather(CACHE_PATH)
+    return df
@@ -4,85 +4,264 @@ baixar_xls_bs4.py
 
 - Acessa a página de estimativas do IBGE, encontra o link do arquivo Excel (.xls/.xlsx)
   e baixa o arquivo original para um diretório local.
-- Usa BeautifulSoup para localizar links <a href="...">.
+- Usa selectolax (parser Lexbor, em C) para localizar todos os links <a href="...">
+  .xls/.xlsx da página; a escolha do link preferido (PREFER_PATTERN) fica em choose_link.
+  (versões anteriores usavam BeautifulSoup, daí o nome do arquivo)
+- Todas as requisições usam a sessão HTTP compartilhada (common/http.py), que segue
+  redirecionamentos e repete requisições em erros temporários (502, 503, 504).
+  A página (www.ibge.gov.br) e o arquivo (ftp.ibge.gov.br) ficam em servidores
+  diferentes, então usam conexões distintas; o HEAD e o download reaproveitam
+  a conexão do arquivo (keep-alive).
+- As duas requisições são feitas em sequência de propósito: o link do arquivo só é
+  conhecido depois de ler a página, então não há o que executar em paralelo
+  (asyncio/aiohttp não traria ganho para um único download).
+- Guarda ETag/Last-Modified da página em ibge_page_cache.json: nas execuções seguintes
+  faz um GET condicional e, se a página não mudou (304), reaproveita os links salvos.
+- Se o arquivo já existe com o mesmo tamanho informado pelo servidor (HEAD), não baixa de novo.
+- Quando o servidor aceita Range, o arquivo é baixado em 4 trechos paralelos, gravados
+  direto na posição certa do arquivo (os.pwrite); senão, em um único fluxo.
+  Cada trecho usa a sua própria conexão do pool da sessão (HTTP/1.1).
+- O download é gravado em um arquivo temporário (.part) e renomeado só no final.
+- Com o tamanho conhecido (Content-Length), o arquivo é reservado em disco de uma vez
+  (os.posix_fallocate), evitando que o sistema de arquivos o aumente a cada gravação.
 
 Dependências:
-pip install requests beautifulsoup4
+pip install requests selectolax brotli
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-import requests
-from bs4 import BeautifulSoup
-from urllib.parse import urljoin, urlparse
+import json
+import os
 import re
+import shutil
+from selectolax.lexbor import LexborHTMLParser
+from urllib.parse import urljoin, urlparse
+from common.http import SESSION
 
 PAGE_URL = "https://www.ibge.gov.br/estatisticas/sociais/populacao/9103-estimativas-de-populacao.html?=&t=resultados"
 OUTDIR = Path.home() / "Desktop" / "ebac" / "EBAC_PYTHON_WEBSCRAPING" / "data" / "raw"
 OUTDIR.mkdir(parents=True, exist_ok=True)
 
+# Cache da página (validadores HTTP + links encontrados), usado em GETs condicionais
+PAGE_CACHE = OUTDIR / "ibge_page_cache.json"
+
 HEADERS = {"User-Agent": "ScriptIBGE/BS4 - contato: seu-email@exemplo.com"}
 
+# Página HTML: aceita Brotli (br), bem menor que gzip; o urllib3 descompacta em C
+# (requer o pacote brotli). O .xls já é binário, então é pedido sem compressão.
+PAGE_HEADERS = {**HEADERS, "Accept-Encoding": "br, gzip, deflate"}
+DOWNLOAD_HEADERS = {**HEADERS, "Accept-Encoding": "identity"}
+
+# Regex compilada uma única vez: hrefs que terminam em .xls ou .xlsx (case-insensitive)
+XLS_RE = re.compile(r"\.xlsx?($|\?)", re.IGNORECASE)
+
 # opcional: padrão para preferir (ex.: "POP2025"); se None, pega primeiro .xls/.xlsx encontrado
 PREFER_PATTERN = "POP2025"  # coloque None para não usar preferência
 
+def load_page_cache(page_url):
+    """
+    Lê o cache da página (ETag, Last-Modified e links encontrados na última execução).
+    Retorna None se não houver cache válido para esta URL.
+    """
+    try:
+        cache = json.loads(PAGE_CACHE.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return None
+    return cache if cache.get("url") == page_url else None
+
 def find_excel_links(page_url):
-    r = requests.get(page_url, headers=HEADERS, timeout=30)
-    r.raise_for_status()
-    soup = BeautifulSoup(r.text, "html.parser")
+    """
+    Retorna todos os hrefs .xls/.xlsx da página.
+    """
+    # GET condicional: se a página não mudou, o servidor responde 304 sem corpo
+    cache = load_page_cache(page_url)
+    headers = dict(PAGE_HEADERS)
+    if cache:
+        if cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+        if cache.get("last_modified"):
+            headers["If-Modified-Since"] = cache["last_modified"]
 
     links = []
-    for a in soup.find_all("a", href=True):
-        href = a["href"].strip()
-        # considerar só links que terminam em .xls ou .xlsx (case-insensitive)
-        if re.search(r"\.xls(x)?($|\?)", href, flags=re.IGNORECASE):
-            links.append(href)
+    r = SESSION.get(page_url, headers=headers, timeout=30)
+    if r.status_code == 304 and cache:
+        # página inalterada: reaproveita os links da última execução, sem analisar o HTML
+        return cache["links"]
+    r.raise_for_status()
+
+    # o Lexbor recebe os bytes (r.content) e só cria objetos Python para os nós pedidos
+    tree = LexborHTMLParser(r.content)
+    for a in tree.css("a[href]"):
+        href = (a.attributes.get("href") or "").strip()
+
+        # considerar só links que terminam em .xls ou .xlsx (regex pré-compilada)
+        if not XLS_RE.search(href):
+            continue
+        links.append(href)
+
+    # guarda os validadores da resposta para a próxima execução
+    etag = r.headers.get("ETag")
+    last_modified = r.headers.get("Last-Modified")
+
+    if etag or last_modified:
+        PAGE_CACHE.write_text(json.dumps({
+            "url": page_url,
+            "etag": etag,
+            "last_modified": last_modified,
+            "links": links
+        }), encoding="utf-8")
+
     # retornar lista de hrefs (talvez relativos)
     return links
 
 def choose_link(links, base_url, prefer_pattern=None):
     if not links:
         return None
-    abs_links = [urljoin(base_url, href) for href in links]
+    # (url absoluta, nome do arquivo em minúsculas) calculados uma única vez por link
+    parsed = []
+    for href in links:
+        u = urljoin(base_url, href)
+        parsed.append((u, urlparse(u).path.rsplit("/", 1)[-1].lower()))
     if prefer_pattern:
         # prioriza links cujo nome contenha o padrão (case-insensitive)
-        for u in abs_links:
-            if prefer_pattern.lower() in Path(urlparse(u).path).name.lower():
-                return u
+        pattern = prefer_pattern.lower()
+        preferred = next((u for u, name in parsed if pattern in name), None)
+        if preferred:
+            return preferred
     # fallback: se houver vários, escolher o primeiro que contenha 'POP' ou o primeiro da lista
-    for u in abs_links:
-        name = Path(urlparse(u).path).name.lower()
-        if "pop" in name:
-            return u
-    return abs_links[0]
+    return next((u for u, name in parsed if "pop" in name), parsed[0][0])
+
+def head_file(url):
+    """
+    Consulta (HEAD) o tamanho do arquivo no servidor e se ele aceita downloads por partes.
+    Retorna (tamanho ou None, aceita_range).
+    """
+    head = SESSION.head(url, headers=DOWNLOAD_HEADERS, allow_redirects=True, timeout=30)
+    if not head.ok:
+        return None, False
+    size = head.headers.get("Content-Length")
+    accepts_ranges = head.headers.get("Accept-Ranges", "").lower() == "bytes"
+    return (int(size) if size is not None else None), accepts_ranges
+
+def preallocate(fd, size):
+    """
+    Reserva 'size' bytes em disco para o descritor 'fd' antes das gravações.
+    Usa os.posix_fallocate (Linux/Unix); onde não existe (ex.: Windows) ou o sistema
+    de arquivos não suporta, apenas define o tamanho final com os.ftruncate.
+    """
+    if hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+            return
+        except OSError:
+            pass
+    os.ftruncate(fd, size)
+
+class RangeIgnoredError(RuntimeError):
+    """O servidor respondeu 200 (arquivo inteiro) a uma requisição com Range."""
 
-def download_file(url, dest_path, chunk_size=8192):
+def download_range(url, fd, start, end, chunk_size):
+    """
+    Baixa os bytes [start, end] de 'url' e grava no descritor 'fd' na mesma posição (os.pwrite).
+    """
+    headers = {**DOWNLOAD_HEADERS, "Range": f"bytes={start}-{end}"}
+    with SESSION.get(url, stream=True, headers=headers, timeout=60) as r:
+        r.raise_for_status()
+        if r.status_code != 206:
+            raise RangeIgnoredError(f"Servidor ignorou o Range bytes={start}-{end} (status {r.status_code})")
+        offset = start
+        while chunk := r.raw.read(chunk_size):
+            os.pwrite(fd, chunk, offset)
+            offset += len(chunk)
+    if offset != end + 1:
+        raise IOError(f"Download incompleto do trecho bytes={start}-{end}")
+
+def download_file(url, dest_path, total=None, accepts_ranges=False, chunk_size=1024 * 1024, parts=4):
+    """
+    Baixa 'url' para 'dest_path'.
+    Se o servidor informar o tamanho e aceitar Range, divide o arquivo em 'parts' trechos
+    baixados em paralelo; caso contrário (ou sem os.pwrite, ex.: Windows), usa um único fluxo.
+    Se o servidor anunciar Range mas ignorá-lo no GET, recomeça em um único fluxo.
+    """
     print("Baixando:", url)
-    r = requests.get(url, stream=True, headers=HEADERS, timeout=60)
-    r.raise_for_status()
-    with open(dest_path, "wb") as f:
-        for chunk in r.iter_content(chunk_size=chunk_size):
-            if chunk:
-                f.write(chunk)
+    # grava em "<nome>.part" e só renomeia ao final: um download interrompido
+    # nunca deixa um arquivo incompleto com o nome definitivo
+    tmp_path = dest_path.with_name(dest_path.name + ".part")
+    try:
+        ranged = bool(total and accepts_ranges and hasattr(os, "pwrite"))
+        if ranged:
+            # trechos de tamanho igual: [(0, n-1), (n, 2n-1), ...]
+            step = -(-total // parts)
+            ranges = [(start, min(start + step, total) - 1) for start in range(0, total, step)]
+
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                preallocate(fd, total)  # cria o arquivo já com o tamanho final
+                with ThreadPoolExecutor(max_workers=parts) as executor:
+                    futures = [
+                        executor.submit(download_range, url, fd, start, end, chunk_size)
+                        for start, end in ranges
+                    ]
+                    # result() propaga qualquer erro ocorrido dentro das threads
+                    for future in futures:
+                        future.result()
+            except RangeIgnoredError as e:
+                print(f"{e}; baixando em um único fluxo")
+                ranged = False
+            finally:
+                os.close(fd)
+        if not ranged:
+            with SESSION.get(url, stream=True, headers=DOWNLOAD_HEADERS, timeout=60) as r:
+                r.raise_for_status()
+                r.raw.decode_content = True  # descompacta gzip/deflate, se o servidor usar
+                # tamanho em disco só é conhecido se o corpo vier sem compressão
+                size = None
+                if "Content-Encoding" not in r.headers and r.headers.get("Content-Length"):
+                    size = int(r.headers["Content-Length"])
+                # shutil.copyfileobj copia rede -> disco em blocos de 1 MiB, sem laço em Python
+                with open(tmp_path, "wb") as f:
+                    if size:
+                        preallocate(f.fileno(), size)
+                    shutil.copyfileobj(r.raw, f, length=chunk_size)
+                    # com o espaço reservado, um corpo truncado deixaria zeros no final
+                    if size and f.tell() != size:
+                        raise IOError(f"Download incompleto: {f.tell()} de {size} bytes")
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    os.replace(tmp_path, dest_path)  # renomeação atômica
     print("Salvo em:", dest_path)
     return dest_path
 
 def main():
-    print("Buscando links de Excel na página...")
-    links = find_excel_links(PAGE_URL)
-    if not links:
-        print("Nenhum link .xls/.xlsx encontrado na página.")
-        return
+    try:
+        print("Buscando links de Excel na página...")
+        links = find_excel_links(PAGE_URL)
+        if not links:
+            print("Nenhum link .xls/.xlsx encontrado na página.")
+            return
+
+        chosen = choose_link(links, PAGE_URL, prefer_pattern=PREFER_PATTERN)
+        if not chosen:
+            print("Não foi possível escolher um link a partir das opções:", links)
+            return
 
-    chosen = choose_link(links, PAGE_URL, prefer_pattern=PREFER_PATTERN)
-    if not chosen:
-        print("Não foi possível escolher um link a partir das opções:", links)
-        return
+        filename = Path(urlparse(chosen).path).name
+        out_path = OUTDIR / filename
 
-    filename = Path(urlparse(chosen).path).name
-    out_path = OUTDIR / filename
+        # arquivo local já igual ao do servidor (mesmo Content-Length): nada a baixar
+        total, accepts_ranges = head_file(chosen)
+        if total is not None and out_path.exists() and out_path.stat().st_size == total:
+            print("Arquivo já atualizado em:", out_path)
+            return
 
-    # baixar e salvar apenas o arquivo original .xls/.xlsx
-    download_file(chosen, out_path)
+        # baixar e salvar apenas o arquivo original .xls/.xlsx
+        # (depende do link obtido acima, por isso roda depois da busca na página)
+        download_file(chosen, out_path, total=total, accepts_ranges=accepts_ranges)
+    finally:
+        # fecha as conexões mantidas abertas pela sessão
+        SESSION.close()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,47 @@
+# PROJETO: Web Scraping de Dados Introdução
+# OBJETIVO: Executar todo o pipeline (coleta, integração, análise e gráficos) em um único processo.
+
+# Metodologia:
+"""
+Este script executa, em sequência e no mesmo processo Python, a função main() de cada etapa.
+
+ETAPAS DO PROCESSO:
+1. COLETA: 1_ibge_municipios_api.py e 3_col_pop.py (municípios e população do IBGE)
+2. INTEGRAÇÃO: 4_join_pop_mun.py (gera pop_mun_final.parquet)
+3. CARGA ÚNICA: load_clean() lê e limpa a base final apenas uma vez
+4. ANÁLISE: 5_descritiva.py, 6_graficos.py, 7_mapaBR.py e 8_mapaRR.py recebem o mesmo
+   DataFrame em memória, sem reler o arquivo em cada script
+
+COMO USAR:
+    python run_all.py
+
+OBSERVAÇÕES:
+- Os mapas (7 e 8) precisam dos shapefiles em data/dados_shapefile (veja shapefile.mkd)
+- O script 2_ibge_pop_request.py não é executado: o 3_col_pop.py já baixa a planilha
+
+GLOSSÁRIO:
+- importlib: permite importar os scripts cujo nome começa com número (ex.: "5_descritiva")
+"""
+
+import importlib
+from common.loader import load_clean
+
+COLETA = ["1_ibge_municipios_api", "3_col_pop", "4_join_pop_mun"]
+ANALISE = ["5_descritiva", "6_graficos", "7_mapaBR", "8_mapaRR"]
+
+def main():
+    for nome in COLETA:
+        print(f"\n===== {nome} =====")
+        importlib.import_module(nome).main()
+
+    # Base final carregada uma única vez e compartilhada pelas análises
+    df = load_clean()
+
+    for nome in ANALISE:
+        print(f"\n===== {nome} =====")
+        importlib.import_module(nome).main(df)
+
+if __name__ == "__main__":
+    main()
+
+# Fim do script #